@@ -5,7 +5,8 @@ from pythogic.base.Symbol import Symbol
 
 class Alphabet(object):
     def __init__(self, symbols: Set[Symbol]):
-        self.symbols = symbols
+        # stored as a frozenset, so that membership tests on the symbols are always O(1)
+        self.symbols = frozenset(symbols)
 
     @staticmethod
     def fromStrings(symbol_strings:Set[str]):
@@ -268,49 +268,54 @@ class LDLf_EmptyTraces(FormalSystem):
             final_states.add(frozenset([nnf_f]))
 
         states = {frozenset(), frozenset([nnf_f])}
+        # delta only depends on its arguments and the states share most of their subformulas:
+        # memoize it for the whole construction.
+        delta_cache = {}
+        def compute_delta(subf, actions_set, epsilon=False):
+            key = (subf, actions_set, epsilon)
+            if key not in delta_cache:
+                delta_cache[key] = self.delta(subf, actions_set, epsilon)
+            return delta_cache[key]
+
+        # local bindings for the functions called in the loop below
+        find_atomics = PL.find_atomics
+        tranform_delta = self._tranform_delta
+        # TrueFormula and FalseFormula are left untouched by _tranform_delta
+        constant_formulas = {TrueFormula(), FalseFormula()}
+
+        # worklist of the states still to expand: every state is expanded exactly once,
+        # since its outgoing transitions only depend on the state itself.
+        states_to_visit = list(states)
+        while states_to_visit:
+            q = states_to_visit.pop()
+            for actions_set in alphabet:
 
-        states_changed, delta_changed = True, True
-        while states_changed or delta_changed:
+                delta_formulas = [compute_delta(subf, actions_set) for subf in q]
+                atomics = {s for subf in delta_formulas for s in find_atomics(subf)} - constant_formulas
 
-            states_changed, delta_changed = False, False
-            for actions_set in alphabet:
-                states_list = list(states)
-                for q in states_list:
+                symbol2formula = {Symbol(str(f)) : f for f in atomics}
+                formula2atomic_formulas = {f : AtomicFormula.fromName(str(f)) for f in atomics}
+                transformed_delta_formulas = [tranform_delta(f, formula2atomic_formulas) for f in delta_formulas]
+                conjunctions = And.chain(transformed_delta_formulas)
 
-                    delta_formulas = [self.delta(subf, actions_set) for subf in q]
-                    atomics = [s for subf in delta_formulas for s in PL.find_atomics(subf)]
+                models = frozenset(PL(Alphabet(set(symbol2formula))).minimal_models(conjunctions))
+                if len(models)==0:
+                    continue
+                for min_model in models:
+                    q_prime = frozenset(symbol2formula[s] for s, truth in min_model.symbol2truth.items() if truth)
 
-                    symbol2formula = {Symbol(str(f)) : f for f in atomics if f != TrueFormula() and f!=FalseFormula()}
-                    formula2atomic_formulas = {f : AtomicFormula.fromName(str(f)) if f != TrueFormula() and f!=FalseFormula() else f for f in atomics}
-                    transformed_delta_formulas = [self._tranform_delta(f, formula2atomic_formulas) for f in delta_formulas]
-                    conjunctions = And.chain(transformed_delta_formulas)
+                    delta.add((q, actions_set, q_prime))
 
-                    models = frozenset(PL(Alphabet(set(symbol2formula))).minimal_models(conjunctions))
-                    if len(models)==0:
+                    if q_prime in states:
                         continue
-                    for min_model in models:
-                        q_prime = frozenset({symbol2formula[s] for s in min_model.symbol2truth if min_model.symbol2truth[s]})
-
-
-                        len_before = len(states)
-                        states.add(q_prime)
-                        if len(states) == len_before + 1:
-                            states_list.append(q_prime)
-                            states_changed = True
-
-                        len_before = len(delta)
-                        delta.add((q, actions_set, q_prime))
-                        if len(delta) == len_before + 1:
-                            delta_changed = True
-
-                        # check if q_prime should be added as final state
-                        if len(q_prime) == 0:
-                            final_states.add(q_prime)
-                        else:
-                            q_prime_delta_conjunction = And.chain([self.delta(subf, frozenset(), epsilon=True) for subf in q_prime])
-                            pl, I = PL._from_set_of_propositionals(set(), Alphabet(set()))
-                            if pl.truth(q_prime_delta_conjunction, I):
-                                final_states.add(q_prime)
+                    states.add(q_prime)
+                    states_to_visit.append(q_prime)
+
+                    # check if q_prime should be added as final state (only once, when it is discovered;
+                    # the initial states are already classified above)
+                    q_prime_delta_conjunction = And.chain([compute_delta(subf, frozenset(), epsilon=True) for subf in q_prime])
+                    if pl.truth(q_prime_delta_conjunction, I):
+                        final_states.add(q_prime)
 
         return {
             "alphabet": alphabet,
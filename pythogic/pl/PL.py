@@ -1,4 +1,5 @@
 """Propositional Logic"""
+from collections import defaultdict
 from typing import Set
 
 from pythogic.base.Alphabet import Alphabet
@@ -163,12 +164,10 @@ class PL(FormalSystem):
     def minimal_models(self, f:Formula)-> Set[PLInterpretation]:
         """Find models of min size (i.e. the less number of proposition to True)."""
         models = self.models(f)
-        size2models = {}
+        size2models = defaultdict(set)
 
         for m in models:
-            size = len([_ for _ in m.symbol2truth if m.symbol2truth[_]])
-            if size not in size2models:
-                size2models[size] = set()
+            size = sum(m.symbol2truth.values())
             size2models[size].add(m)
 
         if not size2models:
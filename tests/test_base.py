@@ -19,3 +19,11 @@ class TestFormula(unittest.TestCase):
         and_chain = And.chain([a, b, c])
         self.assertEqual(and_chain, And(a, And(b, And(c, TrueFormula()))))
 
+
+class TestAlphabet(unittest.TestCase):
+
+    def test_symbols_frozenset(self):
+        a_sym, b_sym = Symbol("a"), Symbol("b")
+        alphabet = Alphabet([a_sym, b_sym, a_sym])
+        self.assertIsInstance(alphabet.symbols, frozenset)
+        self.assertEqual(alphabet.symbols, {a_sym, b_sym})